@@ -1,8 +1,10 @@
 """Health check endpoint."""
 
+import hashlib
+
 from pydantic import BaseModel
+from robyn import Response, status_codes
 
-from app.core.logger import LogIcon, logger
 from app.core.router import Router
 from app.core.settings import settings as st
 
@@ -17,7 +19,17 @@ class HealthResponse(BaseModel):
     version: str
 
 
-@router.get("/health")
-async def health_check() -> HealthResponse:
-    logger.info("Health check requested", icon=LogIcon.HEALTHCHECK)
-    return HealthResponse(status="healthy", service=st.API_NAME, version=st.API_VERSION)
+# Const route: Robyn runs the handler once at startup and serves the cached
+# response from Rust, so probes skip the Python wrapper stack entirely. Building the
+# payload here rather than at import keeps spawn workers (which re-import app.main)
+# from resolving project metadata they never serve.
+@router.get("/health", const=True)
+async def health_check() -> Response:
+    body = HealthResponse(status="healthy", service=st.API_NAME, version=st.API_VERSION).model_dump_json()
+    etag = f'"{hashlib.blake2b(body.encode(), digest_size=8).hexdigest()}"'
+    return Response(
+        status_code=status_codes.HTTP_200_OK,
+        # Lets proxies and load balancers answer repeat probes without reaching the app
+        headers={"content-type": "application/json", "cache-control": "public, max-age=5", "etag": etag},
+        description=body,
+    )
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Coroutine
+from types import SimpleNamespace
 from typing import Any
 
 from robyn import Robyn
@@ -12,43 +13,34 @@ from app.core.settings import settings as st
 AsyncHandler = Callable[[], Coroutine[Any, Any, None]]
 
 
-class State:
-    """Mutable application state container with attribute access."""
+class State(SimpleNamespace):
+    """Mutable application state container with attribute access.
 
-    __slots__ = ("_data",)
-
-    def __init__(self) -> None:
-        object.__setattr__(self, "_data", {})
+    Attribute reads and writes go straight to the instance ``__dict__``; ``__getattr__``
+    only runs on a miss to raise a descriptive error. Entries named like a ``State``
+    attribute (``get``, ``clear``, ...) would shadow it, so event names must avoid them.
+    """
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            return self._data[name]
-        except KeyError:
-            raise AttributeError(f"State has no attribute '{name}'") from None
-
-    def __setattr__(self, name: str, value: Any) -> None:
-        self._data[name] = value
+        raise AttributeError(f"State has no attribute '{name}'")
 
     def __delattr__(self, name: str) -> None:
         try:
-            del self._data[name]
+            del self.__dict__[name]
         except KeyError:
             raise AttributeError(f"State has no attribute '{name}'") from None
 
     def __contains__(self, name: str) -> bool:
-        return name in self._data
+        return name in self.__dict__
 
     def __iter__(self):
-        return iter(self._data.keys())
-
-    def __repr__(self) -> str:
-        return f"State({self._data})"
+        return iter(self.__dict__)
 
     def get(self, name: str, default: Any = None) -> Any:
-        return self._data.get(name, default)
+        return self.__dict__.get(name, default)
 
     def clear(self) -> None:
-        self._data.clear()
+        self.__dict__.clear()
 
 
 class BaseEvent[T](ABC):
@@ -82,6 +74,8 @@ class Lifespan:
 
     def register(self, event_cls: type[BaseEvent[Any]]) -> "Lifespan":
         """Register an event class. Returns self for chaining."""
+        if hasattr(State, event_cls.name):
+            raise ValueError(f"{event_cls.__name__}.name '{event_cls.name}' is reserved by State")
         self._event_classes.append(event_cls)
         return self
 
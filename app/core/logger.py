@@ -1,11 +1,16 @@
+import atexit
+import contextlib
 import logging
+import os
+import sys
+import threading
 from dataclasses import dataclass, field
 from enum import StrEnum
+from queue import SimpleQueue
 
 import orjson
 import structlog
 from asgi_correlation_id import correlation_id
-from beartype import beartype
 
 from app.core.settings import settings
 
@@ -91,6 +96,11 @@ class LogIcon(StrEnum):
     BLACKLIST = "🔇"
 
 
+# Plain dict lookup instead of the Enum constructor's value validation on every record.
+# StrEnum members hash like their values, so both raw strings and members resolve.
+_ICON_BY_VALUE: dict[str, LogIcon] = {icon.value: icon for icon in LogIcon}
+
+
 @dataclass
 class LoggerConfig:
     """Logger configuration with debug-specific settings."""
@@ -122,42 +132,155 @@ class BusinessRulesProcessor:
     def __init__(self, debug: bool) -> None:
         self.debug = debug
 
-    @beartype
     def __call__(self, logger, name: str, event_dict: dict) -> dict:
         """Transform event with uppercase, length limit, and optional icon."""
+        raw_icon = event_dict.pop("icon", LogIcon.DEFAULT)
+        icon_enum = _ICON_BY_VALUE.get(raw_icon) if isinstance(raw_icon, str) else None
+        if icon_enum is None:
+            raise LoggerError("Wrong Icon chosen, please choose a valid LogIcon enum member")
+
         try:
             event = str(event_dict.get("event", ""))[:80].upper()
-            icon_enum = LogIcon(event_dict.pop("icon", LogIcon.DEFAULT))
-
-            if self.debug:
-                event = f"{icon_enum.value} {event}"
-
-            event_dict["event"] = event
-            return event_dict
-        except ValueError as err:
-            raise LoggerError("Wrong Icon chosen, please choose a valid LogIcon enum member") from err
         except Exception as ex:
             raise LoggerError(f"Error with extra kwargs passed to the logger: {ex}") from ex
 
+        if self.debug:
+            event = f"{icon_enum.value} {event}"
+
+        event_dict["event"] = event
+        return event_dict
+
+
+# Call sites are finite, so this cache is bounded by the number of logging lines in the codebase
+_LOCATION_CACHE: dict[tuple[str, int], str] = {}
+_LEVEL_LABELS: dict[str, str] = {level.value.lower(): level.value for level in LogLevel}
+
 
 def dev_pipeline_renderer(logger, name: str, event_dict: dict) -> str:
     """Render log events in human-readable format with pipe-separated fields."""
-    reserved_keys = {"timestamp", "level", "event", "filename", "lineno"}
-
-    timestamp = event_dict.get("timestamp", "")
-    level = event_dict.get("level", LogLevel.INFO.value).upper()
-    event = event_dict.get("event", "")
-    filename = event_dict.get("filename", "")
-    lineno = event_dict.get("lineno", "")
+    timestamp = event_dict.pop("timestamp", "")
+    level = event_dict.pop("level", LogLevel.INFO.value)
+    level = _LEVEL_LABELS.get(level) or level.upper()
+    event = event_dict.pop("event", "")
+    filename = event_dict.pop("filename", "")
+    lineno = event_dict.pop("lineno", "")
 
-    location = f"{filename}:{lineno}" if filename else ""
+    location = _LOCATION_CACHE.get((filename, lineno), "")
+    if not location and filename:
+        location = _LOCATION_CACHE[(filename, lineno)] = f"{filename}:{lineno}"
 
-    extra_kwargs = " | ".join(f"{k}={v}" for k, v in event_dict.items() if k not in reserved_keys)
+    # Reserved keys were popped above, so whatever is left are the extra kwargs
+    extra_kwargs = " | ".join(f"{k}={v}" for k, v in event_dict.items())
 
     parts = [timestamp, level, event, extra_kwargs, location]
     return " | ".join(filter(None, parts))
 
 
+type LogLine = str | bytes | None
+
+_LOG_QUEUE: SimpleQueue[LogLine] = SimpleQueue()
+_log_writer: threading.Thread | None = None
+_WRITER_START_LOCK = threading.Lock()
+# Held by the writer around each stdout write; fork() takes it too, so the child never
+# inherits a stdout buffer locked mid-write.
+_WRITE_LOCK = threading.Lock()
+
+
+class QueueLogger:
+    """Logger that enqueues rendered lines instead of writing them on the caller's thread."""
+
+    __slots__ = ("_queue",)
+
+    def __init__(self, queue: SimpleQueue[LogLine]) -> None:
+        self._queue = queue
+
+    def msg(self, message: str | bytes) -> None:
+        if _log_writer is None:
+            _start_log_writer()
+        self._queue.put_nowait(message)
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+class QueueLoggerFactory:
+    """Produce QueueLoggers feeding the shared log queue drained by the writer thread."""
+
+    def __call__(self, *args) -> QueueLogger:
+        return QueueLogger(_LOG_QUEUE)
+
+
+def _write_line(message: str | bytes) -> None:
+    """Write one line to stdout; bytes are decoded when stdout has no binary buffer (e.g. StringIO)."""
+    stream = sys.stdout
+    if isinstance(message, bytes):
+        if (buffer := getattr(stream, "buffer", None)) is not None:
+            buffer.write(message + b"\n")
+            return
+        message = message.decode()
+    stream.write(message + "\n")
+
+
+def write_log_lines(queue: SimpleQueue[LogLine]) -> None:
+    """Drain queued log lines to stdout until a None sentinel, flushing whenever the queue runs dry."""
+    while (message := queue.get()) is not None:
+        # Any failure drops only this line: a dead writer would strand every later line in the queue
+        try:
+            with _WRITE_LOCK:
+                _write_line(message)
+                if queue.empty():
+                    sys.stdout.flush()
+        except Exception:
+            continue
+
+
+def _start_log_writer() -> None:
+    """Start the daemon thread draining the log queue, once, on the first logged line."""
+    global _log_writer
+    with _WRITER_START_LOCK:
+        if _log_writer is not None:
+            return
+        writer = threading.Thread(target=write_log_lines, args=(_LOG_QUEUE,), name="log-writer", daemon=True)
+        writer.start()
+        _log_writer = writer
+
+
+def _lock_writer_before_fork() -> None:
+    """Wait out any in-flight write and flush, so the child inherits an unlocked, empty stdout buffer."""
+    _WRITE_LOCK.acquire()
+    with contextlib.suppress(OSError, ValueError):
+        sys.stdout.flush()
+
+
+def _unlock_writer_after_fork() -> None:
+    _WRITE_LOCK.release()
+
+
+def _reset_log_writer_after_fork() -> None:
+    """Threads do not survive fork: drop the parent's pending lines; the child's first log restarts the writer."""
+    global _log_writer, _WRITER_START_LOCK
+    _WRITE_LOCK.release()
+    _WRITER_START_LOCK = threading.Lock()
+    _log_writer = None
+    while not _LOG_QUEUE.empty():
+        _LOG_QUEUE.get_nowait()
+
+
+def _stop_log_writer() -> None:
+    """Flush pending log lines on interpreter exit."""
+    if _log_writer is not None and _log_writer.is_alive():
+        _LOG_QUEUE.put_nowait(None)
+        _log_writer.join(timeout=1.0)
+
+
+os.register_at_fork(
+    before=_lock_writer_before_fork,
+    after_in_parent=_unlock_writer_after_fork,
+    after_in_child=_reset_log_writer_after_fork,
+)
+atexit.register(_stop_log_writer)
+
+
 def setup_logging(config: LoggerConfig) -> None:
     """Configure structlog with debug-specific processors."""
     shared_processors = [
@@ -183,9 +306,11 @@ def setup_logging(config: LoggerConfig) -> None:
             structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ]
 
+    # Producers only enqueue; the writer thread does the stdout I/O. orjson bytes
+    # go straight to stdout.buffer without a decode/encode round trip.
     structlog.configure(
         processors=processors,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=QueueLoggerFactory(),
         wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
         cache_logger_on_first_use=True,
     )
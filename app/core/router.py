@@ -2,8 +2,9 @@
 
 import inspect
 from collections.abc import Callable
-from functools import wraps
-from typing import Any
+from dataclasses import dataclass
+from functools import cache, wraps
+from typing import Any, get_origin
 
 import orjson
 from pydantic import BaseModel, ValidationError
@@ -13,15 +14,44 @@ from robyn.types import Body
 
 from app.models.core import BodyType, UploadFile
 
-FILE_UPLOAD_ENDPOINTS: set[str] = set()
+# Copy-on-write registry: rebuilt on each (import-time) registration, so request-time
+# readers always see an immutable snapshot. Read it through the module, not a `from` import.
+FILE_UPLOAD_ENDPOINTS: frozenset[str] = frozenset()
 
+type BodyParser = tuple[str, Callable[[str | bytes], Any]]
 
-def parse_endpoint_signature(
-    sig: inspect.Signature,
-) -> tuple[dict[str, tuple[BodyType, type | None]], set[str]]:
-    """Parse function signature for body and file parameters."""
-    parsed: dict[str, tuple[BodyType, type | None]] = {}
+# Robyn copies header dicts into its own Headers object, so these can be shared across responses
+_JSON_HEADERS: dict[str, str] = {"content-type": "application/json"}
+_EMPTY_HEADERS: dict[str, str] = {}
+
+
+def register_file_upload_endpoint(path: str) -> None:
+    """Record a file upload endpoint by swapping in a new frozenset."""
+    global FILE_UPLOAD_ENDPOINTS
+    FILE_UPLOAD_ENDPOINTS = FILE_UPLOAD_ENDPOINTS | {path}
+
+
+type BodyConfig = dict[str, tuple[BodyType, type | None]]
+
+REQUEST_PARAM = inspect.Parameter("request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request)
+
+
+@dataclass(frozen=True, slots=True)
+class HandlerSpec:
+    """Decoration-time analysis of a route handler."""
+
+    signature: inspect.Signature
+    body_config: BodyConfig
+    file_params: set[str]
+    wrapped_signature: inspect.Signature
+
+
+def _parse_parameters(sig: inspect.Signature) -> tuple[BodyConfig, set[str], list[inspect.Parameter]]:
+    """Single pass over the signature: body config, file params and the Robyn-facing parameters."""
+    parsed: BodyConfig = {}
     file_params: set[str] = set()
+    # Always include request for Robyn injection
+    new_params = [REQUEST_PARAM]
 
     for name, param in sig.parameters.items():
         annotation = param.annotation
@@ -30,95 +60,174 @@ def parse_endpoint_signature(
             file_params.add(name)
             continue
 
-        match annotation:
-            case type() if issubclass(annotation, BaseModel):
-                parsed[name] = (BodyType.PYDANTIC, type(annotation.__name__, (annotation, Body), {}))
-            case type() if issubclass(annotation, Body):
-                parsed[name] = (BodyType.JSONABLE, annotation)
-            case type() if annotation is dict:
-                parsed[name] = (BodyType.JSONABLE, None)
-            case _ if name == "body":
-                parsed[name] = (BodyType.JSONABLE, None)
+        if annotation is dict:
+            parsed[name] = (BodyType.JSONABLE, None)
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            parsed[name] = (BodyType.PYDANTIC, type(annotation.__name__, (annotation, Body), {}))
+        elif isinstance(annotation, type) and issubclass(annotation, Body):
+            parsed[name] = (BodyType.JSONABLE, annotation)
+        elif name == "body":
+            parsed[name] = (BodyType.JSONABLE, None)
+
+        if name == "request":
+            continue
+        new_params.append(param.replace(annotation=parsed[name][1]) if name in parsed else param)
+
+    return parsed, file_params, new_params
+
 
+def parse_endpoint_signature(sig: inspect.Signature) -> tuple[BodyConfig, set[str]]:
+    """Parse function signature for body and file parameters."""
+    parsed, file_params, _ = _parse_parameters(sig)
     return parsed, file_params
 
 
+@cache
+def analyze_handler(handler: Callable) -> HandlerSpec:
+    """Inspect a handler once; re-decorating the same function reuses the analysis."""
+    sig = inspect.signature(handler)
+    body_config, file_params, new_params = _parse_parameters(sig)
+    return HandlerSpec(sig, body_config, file_params, sig.replace(parameters=new_params))
+
+
+def compile_body_parsers(body_config: BodyConfig) -> tuple[BodyParser, ...]:
+    """Bind each body parameter to its parser once, at decoration time."""
+    parsers: list[BodyParser] = []
+    for param_name, (body_type, model_cls) in body_config.items():
+        match body_type:
+            case BodyType.PYDANTIC if model_cls:
+                parsers.append((param_name, model_cls.model_validate_json))  # type: ignore[union-attr]
+            case BodyType.JSONABLE:
+                parsers.append((param_name, orjson.loads))
+    return tuple(parsers)
+
+
+def unprocessable_response(description: str) -> Response:
+    """Build a 422 JSON Response over the shared headers."""
+    return Response(
+        status_code=status_codes.HTTP_422_UNPROCESSABLE_ENTITY,
+        headers=_JSON_HEADERS,
+        description=description,
+    )
+
+
 def parse_request_body(
-    body_config: dict[str, tuple[BodyType, type | None]],
+    body_parsers: tuple[BodyParser, ...],
     kwargs: dict[str, Any],
 ) -> Response | None:
     """Parse JSON/Pydantic body parameters."""
-    for param_name, (body_type, model_cls) in body_config.items():
-        if param_name not in kwargs:
-            continue
-        raw = kwargs[param_name]
+    for param_name, parse in body_parsers:
+        raw = kwargs.get(param_name)
         if not isinstance(raw, (str, bytes)):
             continue
-
-        match body_type:
-            case BodyType.PYDANTIC if model_cls:
-                try:
-                    kwargs[param_name] = model_cls.model_validate_json(raw)  # type: ignore[union-attr]
-                except ValidationError as ex:
-                    return Response(status_code=422, headers={}, description=ex.json())
-            case BodyType.JSONABLE:
-                try:
-                    kwargs[param_name] = orjson.loads(raw)
-                except orjson.JSONDecodeError as ex:
-                    return Response(status_code=422, headers={}, description=str(ex))
-            case BodyType.RAW:
-                pass
+        try:
+            kwargs[param_name] = parse(raw)
+        except ValidationError as ex:
+            return unprocessable_response(ex.json())
+        except orjson.JSONDecodeError as ex:
+            return unprocessable_response(orjson.dumps({"error": "invalid_json", "detail": str(ex)}).decode())
     return None
 
 
+def missing_files_error(file_params: set[str]) -> str:
+    """Serialize the 422 body for a request missing its files; fixed per endpoint."""
+    return orjson.dumps({"error": "missing_files", "required": sorted(file_params)}).decode()
+
+
 def parse_request_files(
     file_params: set[str],
     request: Request,
     kwargs: dict[str, Any],
+    missing_error: str,
 ) -> Response | None:
     """Transfer request.files to UploadFile kwargs."""
     if not file_params:
         return None
 
-    files = getattr(request, "files", None)
+    try:
+        files = request.files
+    except AttributeError:
+        files = None
     if not files:
-        return Response(
-            status_code=status_codes.HTTP_422_UNPROCESSABLE_ENTITY,
-            headers={"content-type": "application/json"},
-            description=orjson.dumps({"error": "missing_files", "required": list(file_params)}).decode(),
-        )
+        return unprocessable_response(missing_error)
 
+    # Robyn hands over a fresh dict per request; share it instead of copying it per param
+    files = files if isinstance(files, dict) else dict(files)
     for param_name in file_params:
-        kwargs[param_name] = UploadFile(files=dict(files))
+        kwargs[param_name] = UploadFile(files=files)
 
     return None
 
 
+def model_response(result: BaseModel) -> Response:
+    """Serialize a Pydantic model into a JSON Response."""
+    return Response(
+        status_code=status_codes.HTTP_200_OK,
+        headers=_JSON_HEADERS,
+        description=result.model_dump_json(),
+    )
+
+
+def dict_response(result: dict) -> Response:
+    """Serialize a dict into a JSON Response."""
+    return Response(
+        status_code=status_codes.HTTP_200_OK,
+        headers=_JSON_HEADERS,
+        description=orjson.dumps(result).decode(),
+    )
+
+
 def parse_response(result: Any) -> Response:
     """Convert handler result to Response."""
     match result:
         case Response():
             return result
         case BaseModel():
-            return Response(
-                status_code=status_codes.HTTP_200_OK,
-                headers={"content-type": "application/json"},
-                description=result.model_dump_json(indent=4),
-            )
+            return model_response(result)
         case dict():
-            return Response(
-                status_code=status_codes.HTTP_200_OK,
-                headers={"content-type": "application/json"},
-                description=orjson.dumps(result).decode(),
-            )
+            return dict_response(result)
         case _:
             return Response(
                 status_code=status_codes.HTTP_200_OK,
-                headers={},
+                headers=_EMPTY_HEADERS,
                 description=str(result),
             )
 
 
+def build_responder(return_annotation: Any) -> Callable[[Any], Response]:
+    """Specialize response conversion on the handler's declared return type.
+
+    The fast path only costs one isinstance check; results that don't match the
+    annotation fall back to the generic parse_response dispatch.
+    """
+    annotation = get_origin(return_annotation) or return_annotation
+    if not isinstance(annotation, type):
+        return parse_response
+
+    if issubclass(annotation, Response):
+
+        def respond_passthrough(result: Any) -> Response:
+            return result if isinstance(result, Response) else parse_response(result)
+
+        return respond_passthrough
+
+    if issubclass(annotation, BaseModel):
+
+        def respond_model(result: Any) -> Response:
+            return model_response(result) if isinstance(result, BaseModel) else parse_response(result)
+
+        return respond_model
+
+    if issubclass(annotation, dict):
+
+        def respond_dict(result: Any) -> Response:
+            return dict_response(result) if isinstance(result, dict) else parse_response(result)
+
+        return respond_dict
+
+    return parse_response
+
+
 HTTP_METHODS = (
     HttpMethod.GET,
     HttpMethod.POST,
@@ -131,6 +240,9 @@ HTTP_METHODS = (
     HttpMethod.CONNECT,
 )
 
+# Robyn's HttpMethod is a Rust enum without `.name`, so derive the names once from its repr
+HTTP_METHOD_NAMES: tuple[str, ...] = tuple(str(method).split(".")[-1].lower() for method in HTTP_METHODS)
+
 
 def _create_method_wrapper(original_method: Callable, router_prefix: str = "") -> Callable:
     @wraps(original_method)
@@ -139,20 +251,23 @@ def _create_method_wrapper(original_method: Callable, router_prefix: str = "") -
         decorator = original_method(*args, **kwargs)
 
         def handler_decorator(handler: Callable) -> Callable:
-            sig = inspect.signature(handler)
-            body_config, file_params = parse_endpoint_signature(sig)
-            has_request_param = "request" in sig.parameters
+            spec = analyze_handler(handler)
+            file_params = spec.file_params
+            missing_error = missing_files_error(file_params) if file_params else ""
+            body_parsers = compile_body_parsers(spec.body_config)
+            respond = build_responder(spec.signature.return_annotation)
+            has_request_param = "request" in spec.signature.parameters
 
             if file_params:
                 full_path = f"{router_prefix}{endpoint}".replace("//", "/")
-                FILE_UPLOAD_ENDPOINTS.add(full_path)
+                register_file_upload_endpoint(full_path)
 
             @wraps(handler)
             async def wrapped_handler(request: Request, **h_kwargs):
-                if error := parse_request_body(body_config, h_kwargs):
+                if body_parsers and (error := parse_request_body(body_parsers, h_kwargs)):
                     return error
 
-                if file_params and (error := parse_request_files(file_params, request, h_kwargs)):
+                if file_params and (error := parse_request_files(file_params, request, h_kwargs, missing_error)):
                     return error
 
                 # Pass request to handler only if it declared it
@@ -160,19 +275,9 @@ def _create_method_wrapper(original_method: Callable, router_prefix: str = "") -
                     h_kwargs["request"] = request
 
                 result = await handler(**h_kwargs)
-                return parse_response(result)
-
-            # Build signature: always include request for Robyn injection
-            new_params = [inspect.Parameter("request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request)]
-            for name, param in sig.parameters.items():
-                if name == "request" or name in file_params:
-                    continue
-                if name in body_config:
-                    new_params.append(param.replace(annotation=body_config[name][1]))
-                else:
-                    new_params.append(param)
-
-            wrapped_handler.__signature__ = sig.replace(parameters=new_params)  # type: ignore[attr-defined]
+                return respond(result)
+
+            wrapped_handler.__signature__ = spec.wrapped_signature  # type: ignore[attr-defined]
             return decorator(wrapped_handler)
 
         return handler_decorator
@@ -190,8 +295,7 @@ class Router(SubRouter):
 
     def _wrap_methods(self) -> None:
         """Wrap HTTP methods with parsing logic."""
-        for method in HTTP_METHODS:
-            method_name = str(method).split(".")[-1].lower()
+        for method_name in HTTP_METHOD_NAMES:
             if hasattr(self, method_name):
                 original_method = getattr(self, method_name)
                 wrapped_method = _create_method_wrapper(original_method, self._prefix)
@@ -1,20 +1,35 @@
 """Unified settings for robyn-ml-api."""
 
+import importlib.metadata
 import tomllib
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=1)
 def read_pyproject(pyproject_path: Path) -> dict:
     """Read pyproject.toml into a dict."""
     with pyproject_path.open("rb") as file_handle:
         return tomllib.load(file_handle)
 
 
+@lru_cache(maxsize=1)
 def get_version(base_dir: Path) -> str:
-    """Get version from git tags or fallback to package metadata."""
+    """Get version from the build-time VERSION file, package metadata, or git tags as a last resort."""
+    try:
+        return (base_dir / "VERSION").read_text().strip()
+    except OSError:
+        pass
+
+    try:
+        return importlib.metadata.version("robyn-ml-api")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+
+    # gitpython is heavy to import; only reached from an uninstalled source checkout
     try:
         import git
 
@@ -22,12 +37,7 @@ def get_version(base_dir: Path) -> str:
         latest_tag = max(repo.tags, key=lambda t: t.commit.committed_datetime, default=None)
         return str(latest_tag) if latest_tag else "0.0.0"
     except Exception:
-        try:
-            import importlib.metadata
-
-            return importlib.metadata.version("robyn-ml-api")
-        except Exception:
-            return "0.0.0"
+        return "0.0.0"
 
 
 class Settings(BaseSettings):
@@ -38,10 +48,6 @@ class Settings(BaseSettings):
 
     # ClassVar to prevent Pydantic from trying to load from env
     BASE_DIR: ClassVar[Path] = Path(__file__).parent.parent.parent
-    PROJECT: ClassVar[dict] = read_pyproject(BASE_DIR / "pyproject.toml")
-    API_NAME: ClassVar[str] = PROJECT.get("project", {}).get("name", "robyn-ml-api")
-    API_DESCRIPTION: ClassVar[str] = PROJECT.get("project", {}).get("description", "ML API Template")
-    API_VERSION: ClassVar[str] = get_version(BASE_DIR)
 
     # Server
     API_HOST: str = "0.0.0.0"
@@ -53,6 +59,26 @@ class Settings(BaseSettings):
 
     # Workers
     MAX_WORKERS: int = 4
+    # "loky" reuses joblib's persistent executor (requires the ml extra)
+    POOL_BACKEND: Literal["process", "loky"] = "process"
+
+    # Project metadata is resolved lazily (and cached) so spawned workers that never
+    # touch it skip the pyproject.toml parse and version lookup on import.
+    @property
+    def PROJECT(self) -> dict:  # noqa: N802
+        return read_pyproject(self.BASE_DIR / "pyproject.toml")
+
+    @property
+    def API_NAME(self) -> str:  # noqa: N802
+        return self.PROJECT.get("project", {}).get("name", "robyn-ml-api")
+
+    @property
+    def API_DESCRIPTION(self) -> str:  # noqa: N802
+        return self.PROJECT.get("project", {}).get("description", "ML API Template")
+
+    @property
+    def API_VERSION(self) -> str:  # noqa: N802
+        return get_version(self.BASE_DIR)
 
     @property
     def api_url(self) -> str:
@@ -2,22 +2,31 @@
 
 import multiprocessing as mp
 from collections.abc import Generator
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Executor, ProcessPoolExecutor
 from contextlib import contextmanager
 
 from app.core.lifespan import BaseEvent
 from app.core.settings import settings as st
 
+SPAWN_CTX = mp.get_context("spawn")
+CPU_COUNT = mp.cpu_count()
+
 
 def create_process_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
     """Create ProcessPoolExecutor with spawn context for asyncio compatibility."""
-    ctx = mp.get_context("spawn")
     return ProcessPoolExecutor(
-        max_workers=max_workers or mp.cpu_count(),
-        mp_context=ctx,
+        max_workers=max_workers or CPU_COUNT,
+        mp_context=SPAWN_CTX,
     )
 
 
+def create_reusable_pool(max_workers: int | None = None) -> Executor:
+    """Get joblib's loky reusable executor; its workers persist across calls."""
+    from joblib.externals.loky import get_reusable_executor
+
+    return get_reusable_executor(max_workers=max_workers or CPU_COUNT)
+
+
 @contextmanager
 def process_pool_context(max_workers: int | None = None) -> Generator[ProcessPoolExecutor, None, None]:
     """Context manager for temporary process pool usage."""
@@ -28,16 +37,17 @@ def process_pool_context(max_workers: int | None = None) -> Generator[ProcessPoo
         pool.shutdown(wait=True)
 
 
-class ProcessPoolEvent(BaseEvent[ProcessPoolExecutor]):
-    """Manages ProcessPoolExecutor lifecycle."""
+class ProcessPoolEvent(BaseEvent[Executor]):
+    """Manages the process pool lifecycle."""
 
     name = "process_pool"
 
-    async def startup(self) -> ProcessPoolExecutor:
-        """Create and return the process pool."""
-        max_workers = st.MAX_WORKERS or mp.cpu_count()
-        return create_process_pool(max_workers=max_workers)
+    async def startup(self) -> Executor:
+        """Create and return the process pool for the configured backend."""
+        if st.POOL_BACKEND == "loky":
+            return create_reusable_pool(max_workers=st.MAX_WORKERS or None)
+        return create_process_pool(max_workers=st.MAX_WORKERS or None)
 
-    async def shutdown(self, instance: ProcessPoolExecutor) -> None:
+    async def shutdown(self, instance: Executor) -> None:
         """Shutdown the process pool."""
         instance.shutdown(wait=True)
@@ -24,6 +24,7 @@ app.shutdown_handler(lifespan.shutdown)
 # Middlewares
 middlewares = MiddlewareHandler(app)
 middlewares.register(FileUploadOpenAPIMiddleware)
+middlewares.freeze()
 
 # Routers
 app.include_router(health_router)
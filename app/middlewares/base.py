@@ -1,35 +1,42 @@
 """Base middleware architecture for Robyn applications."""
 
-from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from inspect import isawaitable, iscoroutinefunction
+from typing import Any, ClassVar
 
 from robyn import Request, Response, Robyn
 
 from app.core.logger import LogIcon, logger
 
 
-class BaseMiddleware(ABC):
-    """Abstract base class for middlewares with before/after hooks."""
+class BaseMiddleware:
+    """Base class for middlewares with before/after hooks; subclasses override at least one."""
+
+    __slots__ = ("app",)
 
     endpoints: frozenset[str] = frozenset()
+    _has_before: ClassVar[bool] = False
+    _has_after: ClassVar[bool] = False
+    _targets: ClassVar[tuple[str | None, ...]] = (None,)
 
     def __init__(self, app: Robyn) -> None:
         self.app = app
 
     def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
-        # Check that at least one of before/after is implemented
-        before_abstract = getattr(cls.before, "__isabstractmethod__", False)
-        after_abstract = getattr(cls.after, "__isabstractmethod__", False)
-        if before_abstract and after_abstract:
+        # Resolve once per class which hooks are overridden; at least one is required
+        cls._has_before = cls.before is not BaseMiddleware.before
+        cls._has_after = cls.after is not BaseMiddleware.after
+        if not (cls._has_before or cls._has_after):
             raise TypeError(f"{cls.__name__} must implement at least one of before/after")
+        # None registers a Robyn global middleware: one registration that also covers
+        # routes included later, instead of enumerating the app's routes.
+        cls._targets = tuple(cls.endpoints) or (None,)
 
-    @abstractmethod
-    def before(self, request: Request) -> Request | Response:
-        """Called before request handling. Return Request to continue or Response to short-circuit."""
+    def before(self, request: Request) -> Request | Response | Awaitable[Request | Response]:
+        """Called before request handling. Return Request to continue or Response to short-circuit; may be async."""
         return request
 
-    @abstractmethod
     def after(self, response: Response) -> Response:
         """Called after request handling. Return modified Response."""
         return response
@@ -38,43 +45,95 @@ class BaseMiddleware(ABC):
 class MiddlewareHandler:
     """Manages middleware registration for a Robyn application."""
 
+    __slots__ = ("_after_registry", "_app", "_before_registry", "_frozen", "_middlewares")
+
     def __init__(self, app: Robyn) -> None:
         self._app = app
         self._middlewares: list[BaseMiddleware] = []
+        # Hook chains per endpoint (None = global); freeze() gives each chain one Robyn dispatcher
+        self._before_registry: dict[str | None, list[Callable]] = {}
+        self._after_registry: dict[str | None, list[Callable]] = {}
+        self._frozen = False
+        self._guard_start()
 
     def register(self, middleware_cls: type[BaseMiddleware]) -> "MiddlewareHandler":
         """Register a middleware class. Instantiates with app. Returns self for chaining."""
+        if self._frozen:
+            raise RuntimeError(f"Cannot register {middleware_cls.__name__}: middlewares are frozen")
         middleware = middleware_cls(self._app)
         self._middlewares.append(middleware)
         self._apply_middleware(middleware)
         logger.info(f"Registered middleware: {middleware_cls.__name__}", icon=LogIcon.ADAPTER)
         return self
 
+    def freeze(self) -> "MiddlewareHandler":
+        """Seal registration and register one dispatcher per endpoint and hook. Returns self."""
+        # Robyn rejects a second route middleware on the same scoped endpoint, so dispatchers
+        # are only registered here, once every chain is complete.
+        if self._frozen:
+            return self
+        self._frozen = True
+        for endpoint, hooks in self._before_registry.items():
+            self._register_before(endpoint, tuple(hooks))
+        for endpoint, hooks in self._after_registry.items():
+            self._register_after(endpoint, tuple(hooks))
+        return self
+
+    def _guard_start(self) -> None:
+        """Make app.start() fail loudly if registered middlewares were never frozen."""
+        # Nothing reaches Robyn until freeze(); without this guard a missing freeze() call
+        # silently serves every route unmiddlewared. Robyn keeps a single startup handler
+        # slot (owned by the lifespan), so the check wraps start() instead.
+        start = self._app.start
+
+        def guarded_start(*args: Any, **kwargs: Any) -> Any:
+            if self._middlewares and not self._frozen:
+                names = ", ".join(type(middleware).__name__ for middleware in self._middlewares)
+                raise RuntimeError(f"MiddlewareHandler.freeze() was never called; not applied: {names}")
+            return start(*args, **kwargs)
+
+        setattr(self._app, "start", guarded_start)  # noqa: B010 - instance override of a method
+
     def _apply_middleware(self, middleware: BaseMiddleware) -> None:
-        """Apply middleware to endpoints."""
-        endpoints = middleware.endpoints or self._get_all_routes()
-        has_before = not getattr(middleware.before, "__isabstractmethod__", False)
-        has_after = not getattr(middleware.after, "__isabstractmethod__", False)
-
-        for endpoint in endpoints:
-            if has_before:
-                self._register_before(endpoint, middleware.before)
-            if has_after:
-                self._register_after(endpoint, middleware.after)
-
-    def _get_all_routes(self) -> frozenset[str]:
-        """Get all registered routes from the app."""
-        routes = self._app.get_all_routes()  # type: ignore[possibly-missing-attribute]
-        return frozenset(route[1] for route in routes)
-
-    def _register_before(self, endpoint: str, handler: Callable) -> None:
-        """Register a before_request handler for an endpoint."""
+        """Add middleware hooks to its endpoints' chains, or the global chain when it declares none."""
+        for endpoint in middleware._targets:
+            if middleware._has_before:
+                self._before_registry.setdefault(endpoint, []).append(middleware.before)
+            if middleware._has_after:
+                self._after_registry.setdefault(endpoint, []).append(middleware.after)
+
+    def _register_before(self, endpoint: str | None, hooks: tuple[Callable, ...]) -> None:
+        """Register the before dispatcher for an endpoint's hook chain."""
+        if any(iscoroutinefunction(hook) for hook in hooks):
+
+            @self._app.before_request(endpoint)
+            async def async_before_dispatch(request: Request) -> Request | Response:
+                for hook in hooks:
+                    result = hook(request)
+                    if isawaitable(result):
+                        result = await result
+                    if isinstance(result, Response):
+                        return result
+                    request = result
+                return request
+
+            return
+
+        # All hooks are sync: a plain dispatcher spares Robyn a coroutine per request
         @self._app.before_request(endpoint)
-        async def before_wrapper(request: Request) -> Request | Response:
-            return handler(request)
+        def before_dispatch(request: Request) -> Request | Response:
+            for hook in hooks:
+                result = hook(request)
+                if isinstance(result, Response):
+                    return result
+                request = result
+            return request
+
+    def _register_after(self, endpoint: str | None, hooks: tuple[Callable, ...]) -> None:
+        """Register the after dispatcher for an endpoint's hook chain."""
 
-    def _register_after(self, endpoint: str, handler: Callable) -> None:
-        """Register an after_request handler for an endpoint."""
         @self._app.after_request(endpoint)
-        def after_wrapper(response: Response) -> Response:
-            return handler(response)
+        def after_dispatch(response: Response) -> Response:
+            for hook in hooks:
+                response = hook(response)
+            return response
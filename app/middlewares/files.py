@@ -1,56 +1,102 @@
 """File upload middleware for OpenAPI multipart/form-data patching."""
 
 import orjson
-from robyn import Request, Response, Robyn
+from robyn import Response, Robyn
 
-from app.core.router import FILE_UPLOAD_ENDPOINTS
+from app.core import router
 from app.middlewares.base import BaseMiddleware
 
+# Serialized once; orjson.dumps splices the fragment verbatim into every patched operation
+_MULTIPART_REQUEST_BODY = orjson.Fragment(
+    orjson.dumps(
+        {
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "file": {
+                                "type": "string",
+                                "format": "binary",
+                                "description": "File to upload",
+                            }
+                        },
+                        "required": ["file"],
+                    }
+                }
+            },
+            "required": True,
+        }
+    )
+)
+
+
+# Path items may also carry summary/description/parameters/servers; only operations get a body
+_HTTP_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace"})
+
 
 class FileUploadOpenAPIMiddleware(BaseMiddleware):
     """Patches OpenAPI responses to use multipart/form-data for file upload endpoints."""
 
+    __slots__ = ("_cache",)
+
     endpoints = frozenset(["/openapi.json"])
+    cache_size = 4
 
     def __init__(self, app: Robyn) -> None:
         super().__init__(app)
+        # Raw spec -> patched spec. The spec and upload endpoints are fixed after startup,
+        # so after the first request this skips the parse/patch/serialize entirely.
+        self._cache: dict[str | bytes, bytes] = {}
 
-    def before(self, request: Request) -> Request:
-        return request
+    @staticmethod
+    def _mentions_any(description: str | bytes, endpoints: frozenset[str]) -> bool:
+        """Check whether any endpoint appears as a quoted JSON string in the raw spec."""
+        if isinstance(description, bytes):
+            return any(f'"{endpoint}"'.encode() in description for endpoint in endpoints)
+        return any(f'"{endpoint}"' in description for endpoint in endpoints)
 
     def after(self, response: Response) -> Response:
         """Patch OpenAPI spec with multipart/form-data for file upload endpoints."""
-        if not FILE_UPLOAD_ENDPOINTS:
+        upload_endpoints = router.FILE_UPLOAD_ENDPOINTS
+        if not upload_endpoints:
+            return response
+
+        original = response.description
+        if (patched := self._cache.get(original)) is not None:
+            response.description = patched
+            return response
+
+        # Cheap raw-text pre-check: a spec that never mentions an upload path needs no parsing.
+        # False positives (e.g. the path inside a description) just fall through to the full patch.
+        if not self._mentions_any(original, upload_endpoints):
             return response
 
         try:
-            spec = orjson.loads(response.description)
-            paths = spec.get("paths", {})
-
-            for endpoint in FILE_UPLOAD_ENDPOINTS:
-                if endpoint in paths:
-                    for method in paths[endpoint]:
-                        paths[endpoint][method]["requestBody"] = {
-                            "content": {
-                                "multipart/form-data": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "file": {
-                                                "type": "string",
-                                                "format": "binary",
-                                                "description": "File to upload",
-                                            }
-                                        },
-                                        "required": ["file"],
-                                    }
-                                }
-                            },
-                            "required": True,
-                        }
-
-            response.description = orjson.dumps(spec).decode()
-        except Exception:
-            pass
+            spec = orjson.loads(original)
+        except orjson.JSONDecodeError:
+            return response
+        paths = spec.get("paths") if isinstance(spec, dict) else None
+        if not isinstance(paths, dict):
+            return response
+
+        # Drive the loop from the smaller side; both support O(1) membership
+        if len(upload_endpoints) <= len(paths):
+            targets = (paths.get(endpoint) for endpoint in upload_endpoints)
+        else:
+            targets = (operations for path, operations in paths.items() if path in upload_endpoints)
+
+        for operations in targets:
+            if not isinstance(operations, dict):
+                continue
+            for method, operation in operations.items():
+                if method in _HTTP_METHODS and isinstance(operation, dict):
+                    operation["requestBody"] = _MULTIPART_REQUEST_BODY
+
+        patched = orjson.dumps(spec)
 
+        if len(self._cache) >= self.cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[original] = patched
+        response.description = patched
         return response
@@ -1,5 +1,6 @@
 """Core models for request/response handling."""
 
+from collections.abc import KeysView
 from enum import StrEnum
 
 
@@ -13,7 +14,10 @@ class BodyType(StrEnum):
 
 
 class UploadFile:
-    """Container for uploaded files from multipart/form-data requests."""
+    """Container for uploaded files from multipart/form-data requests.
+
+    The files mapping is held by reference and treated as read-only.
+    """
 
     __slots__ = ("files",)
 
@@ -26,10 +30,21 @@ class UploadFile:
     def __iter__(self):
         return iter(self.files.items())
 
+    def __contains__(self, name: str) -> bool:
+        return name in self.files
+
+    def __getitem__(self, name: str) -> bytes:
+        return self.files[name]
+
     def get(self, name: str) -> bytes | None:
         """Get file bytes by field name."""
         return self.files.get(name)
 
-    def keys(self) -> list[str]:
-        """Get all file field names."""
-        return list(self.files.keys())
+    def view(self, name: str) -> memoryview | None:
+        """Get a zero-copy read-only view over file bytes by field name."""
+        data = self.files.get(name)
+        return None if data is None else memoryview(data)
+
+    def keys(self) -> KeysView[str]:
+        """Get a view of all file field names."""
+        return self.files.keys()
@@ -142,6 +142,20 @@ class TestLifespan:
         result = lifespan.register(DummyEvent)
         assert result is lifespan
 
+    @pytest.mark.parametrize("name", ["get", "clear", "__dict__"])
+    def test_register_rejects_reserved_state_names(self, name: str) -> None:
+        """Verify event names that would shadow State attributes are rejected."""
+        lifespan = Lifespan(MagicMock())
+
+        class ShadowingEvent(BaseEvent[str]):
+            async def startup(self) -> str:
+                return "shadow"
+
+        ShadowingEvent.name = name
+        with pytest.raises(ValueError, match="reserved by State"):
+            lifespan.register(ShadowingEvent)
+        assert lifespan._event_classes == []
+
     def test_state_is_none_before_startup(self) -> None:
         """Verify state is None before startup runs."""
         mock_app = MagicMock()
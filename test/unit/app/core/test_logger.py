@@ -0,0 +1,167 @@
+"""Tests for structured logging configuration."""
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+from queue import SimpleQueue
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import logger as logger_module
+from app.core.logger import (
+    BusinessRulesProcessor,
+    LoggerError,
+    LogIcon,
+    QueueLogger,
+    dev_pipeline_renderer,
+    write_log_lines,
+)
+
+
+# -----------------------------------------------------------------------------
+# BusinessRulesProcessor Tests
+# -----------------------------------------------------------------------------
+
+
+class TestBusinessRulesProcessor:
+    """Tests for the business rules log processor."""
+
+    def test_uppercases_and_truncates_event(self) -> None:
+        """Verify events are uppercased and capped at 80 characters."""
+        processor = BusinessRulesProcessor(debug=False)
+        event_dict = processor(None, "info", {"event": "x" * 100})
+
+        assert event_dict["event"] == "X" * 80
+
+    @pytest.mark.parametrize("icon", [LogIcon.HEALTHCHECK, LogIcon.HEALTHCHECK.value])
+    def test_prepends_icon_in_debug(self, icon: str) -> None:
+        """Verify icons given as members or raw values are prepended in debug mode."""
+        processor = BusinessRulesProcessor(debug=True)
+        event_dict = processor(None, "info", {"event": "ok", "icon": icon})
+
+        assert event_dict["event"] == f"{LogIcon.HEALTHCHECK.value} OK"
+        assert "icon" not in event_dict
+
+    @pytest.mark.parametrize("icon", ["not-an-icon", ["unhashable"], 42])
+    def test_invalid_icon_raises(self, icon: object) -> None:
+        """Verify unknown or non-string icons raise LoggerError."""
+        processor = BusinessRulesProcessor(debug=True)
+
+        with pytest.raises(LoggerError, match="Wrong Icon"):
+            processor(None, "info", {"event": "ok", "icon": icon})
+
+
+# -----------------------------------------------------------------------------
+# QueueLogger Tests
+# -----------------------------------------------------------------------------
+
+
+class TestQueueLogger:
+    """Tests for the queue-backed log sink."""
+
+    def test_msg_enqueues_without_writing(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Verify log calls only enqueue the rendered line."""
+        queue: SimpleQueue = SimpleQueue()
+        QueueLogger(queue).msg(b'{"event":"HI"}')
+
+        assert queue.get_nowait() == b'{"event":"HI"}'
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize("method", ["debug", "info", "warning", "error", "critical", "exception"])
+    def test_level_methods_alias_msg(self, method: str) -> None:
+        """Verify every level method structlog may proxy to enqueues the line."""
+        queue: SimpleQueue = SimpleQueue()
+        getattr(QueueLogger(queue), method)("line")
+
+        assert queue.get_nowait() == "line"
+
+    def test_msg_starts_writer_lazily(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify the writer thread is started by the first logged line only."""
+        start = MagicMock()
+        monkeypatch.setattr(logger_module, "_log_writer", None)
+        monkeypatch.setattr(logger_module, "_start_log_writer", start)
+        queue: SimpleQueue = SimpleQueue()
+
+        QueueLogger(queue).msg("first")
+        start.assert_called_once_with()
+
+        monkeypatch.setattr(logger_module, "_log_writer", MagicMock())
+        QueueLogger(queue).msg("second")
+        start.assert_called_once_with()
+
+    def test_import_starts_no_thread(self) -> None:
+        """Verify importing the logger leaves the process single-threaded."""
+        code = "import threading, app.core.logger; print(threading.active_count())"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).parents[4]
+        )
+
+        assert result.stdout.strip() == "1"
+
+    def test_write_log_lines_drains_until_sentinel(self, capfd: pytest.CaptureFixture[str]) -> None:
+        """Verify str and bytes lines are written newline-terminated in order."""
+        queue: SimpleQueue = SimpleQueue()
+        for line in ("text line", b"bytes line", None):
+            queue.put(line)
+
+        write_log_lines(queue)
+
+        assert capfd.readouterr().out == "text line\nbytes line\n"
+
+    def test_write_log_lines_decodes_bytes_for_text_only_stdout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify bytes lines still reach a stdout without a binary buffer, such as StringIO."""
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        queue: SimpleQueue = SimpleQueue()
+        for line in (b"bytes line", "text line", None):
+            queue.put(line)
+
+        write_log_lines(queue)
+
+        assert stdout.getvalue() == "bytes line\ntext line\n"
+
+    def test_write_log_lines_survives_failing_write(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify an unexpected error drops only the failing line and the writer keeps draining."""
+        stdout = MagicMock(spec=["write", "flush"])
+        stdout.write.side_effect = [RuntimeError("boom"), None]
+        monkeypatch.setattr(sys, "stdout", stdout)
+        queue: SimpleQueue = SimpleQueue()
+        for line in ("lost", "kept", None):
+            queue.put(line)
+
+        write_log_lines(queue)
+
+        assert [call.args[0] for call in stdout.write.call_args_list] == ["lost\n", "kept\n"]
+        assert queue.empty()
+
+
+# -----------------------------------------------------------------------------
+# dev_pipeline_renderer Tests
+# -----------------------------------------------------------------------------
+
+
+class TestDevPipelineRenderer:
+    """Tests for the human-readable debug renderer."""
+
+    def test_renders_fields_in_order(self) -> None:
+        """Verify reserved fields are laid out around the extra kwargs."""
+        event_dict = {
+            "timestamp": "2025-01-01T00:00:00Z",
+            "level": "info",
+            "event": "HELLO",
+            "filename": "main.py",
+            "lineno": 10,
+            "user": "alice",
+        }
+
+        line = dev_pipeline_renderer(None, "info", event_dict)
+
+        assert line == "2025-01-01T00:00:00Z | INFO | HELLO | user=alice | main.py:10"
+
+    def test_omits_missing_location(self) -> None:
+        """Verify no location suffix is rendered without a filename."""
+        line = dev_pipeline_renderer(None, "warning", {"level": "warning", "event": "CAREFUL"})
+
+        assert line == "WARNING | CAREFUL"
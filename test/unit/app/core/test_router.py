@@ -1,12 +1,25 @@
 """Tests for custom router with body parsing and response handling."""
 
 import inspect
+from types import SimpleNamespace
 
+import orjson
 import pytest
 from pydantic import BaseModel
 from robyn import Response
 
-from app.core.router import parse_endpoint_signature, parse_request_body, parse_response
+from app.core import router
+from app.core.router import (
+    analyze_handler,
+    build_responder,
+    compile_body_parsers,
+    missing_files_error,
+    parse_endpoint_signature,
+    parse_request_body,
+    parse_request_files,
+    parse_response,
+    register_file_upload_endpoint,
+)
 from app.models.core import BodyType, UploadFile
 
 
@@ -94,6 +107,59 @@ class TestPreParseBody:
         assert "files" in file_params
 
 
+# -----------------------------------------------------------------------------
+# analyze_handler Tests
+# -----------------------------------------------------------------------------
+
+
+class TestAnalyzeHandler:
+    """Tests for analyze_handler function."""
+
+    def test_wrapped_signature_injects_request_and_drops_files(self) -> None:
+        """Verify the Robyn-facing signature leads with request and hides file params."""
+
+        async def handler(body: SampleModel, files: UploadFile, request, limit: int = 10) -> None:
+            pass
+
+        spec = analyze_handler(handler)
+        params = spec.wrapped_signature.parameters
+
+        assert list(params) == ["request", "body", "limit"]
+        assert params["body"].annotation is spec.body_config["body"][1]
+        assert spec.file_params == {"files"}
+
+    def test_analysis_is_cached_per_handler(self) -> None:
+        """Verify re-decorating the same handler reuses its analysis."""
+
+        async def handler(data: dict) -> dict:
+            return data
+
+        assert analyze_handler(handler) is analyze_handler(handler)
+
+
+# -----------------------------------------------------------------------------
+# compile_body_parsers Tests
+# -----------------------------------------------------------------------------
+
+
+class TestCompileBodyParsers:
+    """Tests for compile_body_parsers function."""
+
+    def test_binds_parser_per_body_type(self) -> None:
+        """Verify Pydantic and JSONABLE params get their parser, RAW is skipped."""
+        body_config = {
+            "body": (BodyType.PYDANTIC, SampleModel),
+            "data": (BodyType.JSONABLE, None),
+            "raw": (BodyType.RAW, None),
+        }
+
+        parsers = dict(compile_body_parsers(body_config))
+
+        assert parsers["body"] == SampleModel.model_validate_json
+        assert parsers["data"] is orjson.loads
+        assert "raw" not in parsers
+
+
 # -----------------------------------------------------------------------------
 # post_parse_body Tests
 # -----------------------------------------------------------------------------
@@ -107,7 +173,7 @@ class TestPostParseBody:
         body_config = {"body": (BodyType.PYDANTIC, SampleModel)}
         kwargs = {"body": '{"name": "test", "value": 42}'}
 
-        error = parse_request_body(body_config, kwargs)
+        error = parse_request_body(compile_body_parsers(body_config), kwargs)
 
         assert error is None
         assert isinstance(kwargs["body"], SampleModel)
@@ -119,7 +185,7 @@ class TestPostParseBody:
         body_config = {"body": (BodyType.PYDANTIC, SampleModel)}
         kwargs = {"body": '{"name": "test"}'}  # missing 'value'
 
-        error = parse_request_body(body_config, kwargs)
+        error = parse_request_body(compile_body_parsers(body_config), kwargs)
 
         assert isinstance(error, Response)
         assert error.status_code == 422
@@ -129,7 +195,7 @@ class TestPostParseBody:
         body_config = {"data": (BodyType.JSONABLE, None)}
         kwargs = {"data": '{"key": "value"}'}
 
-        error = parse_request_body(body_config, kwargs)
+        error = parse_request_body(compile_body_parsers(body_config), kwargs)
 
         assert error is None
         assert kwargs["data"] == {"key": "value"}
@@ -139,10 +205,12 @@ class TestPostParseBody:
         body_config = {"data": (BodyType.JSONABLE, None)}
         kwargs = {"data": "not valid json"}
 
-        error = parse_request_body(body_config, kwargs)
+        error = parse_request_body(compile_body_parsers(body_config), kwargs)
 
         assert isinstance(error, Response)
         assert error.status_code == 422
+        assert error.headers.get("content-type") == "application/json"
+        assert orjson.loads(error.description)["error"] == "invalid_json"
 
     def test_raw_body_unchanged(self) -> None:
         """Verify RAW body type leaves data unchanged."""
@@ -150,7 +218,7 @@ class TestPostParseBody:
         original = b"raw bytes"
         kwargs = {"data": original}
 
-        error = parse_request_body(body_config, kwargs)
+        error = parse_request_body(compile_body_parsers(body_config), kwargs)
 
         assert error is None
         assert kwargs["data"] == original
@@ -160,11 +228,63 @@ class TestPostParseBody:
         body_config = {"body": (BodyType.PYDANTIC, SampleModel)}
         kwargs = {}  # body not in kwargs
 
-        error = parse_request_body(body_config, kwargs)
+        error = parse_request_body(compile_body_parsers(body_config), kwargs)
 
         assert error is None
 
 
+# -----------------------------------------------------------------------------
+# register_file_upload_endpoint Tests
+# -----------------------------------------------------------------------------
+
+
+class TestRegisterFileUploadEndpoint:
+    """Tests for the file upload endpoint registry."""
+
+    def test_registry_stays_immutable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify registration swaps in a new frozenset instead of mutating the old one."""
+        monkeypatch.setattr(router, "FILE_UPLOAD_ENDPOINTS", frozenset())
+        before = router.FILE_UPLOAD_ENDPOINTS
+
+        register_file_upload_endpoint("/files/upload")
+        after = router.FILE_UPLOAD_ENDPOINTS
+
+        assert after == frozenset({"/files/upload"})
+        assert isinstance(after, frozenset)
+        assert before == frozenset()
+
+
+# -----------------------------------------------------------------------------
+# parse_request_files Tests
+# -----------------------------------------------------------------------------
+
+
+class TestParseRequestFiles:
+    """Tests for parse_request_files function."""
+
+    def test_files_shared_across_params(self) -> None:
+        """Verify every file param receives an UploadFile over the same mapping."""
+        files = {"file": b"content"}
+        request = SimpleNamespace(files=files)
+        kwargs: dict = {}
+
+        error = parse_request_files({"a", "b"}, request, kwargs, "")  # type: ignore[arg-type]
+
+        assert error is None
+        assert kwargs["a"].files is files
+        assert kwargs["b"].files is files
+
+    @pytest.mark.parametrize("request_obj", [SimpleNamespace(files={}), SimpleNamespace()])
+    def test_missing_files_returns_422(self, request_obj) -> None:
+        """Verify empty or absent files return 422 Response."""
+        missing_error = missing_files_error({"files"})
+        error = parse_request_files({"files"}, request_obj, {}, missing_error)
+
+        assert isinstance(error, Response)
+        assert error.status_code == 422
+        assert orjson.loads(error.description) == {"error": "missing_files", "required": ["files"]}
+
+
 # -----------------------------------------------------------------------------
 # parse_response Tests
 # -----------------------------------------------------------------------------
@@ -223,6 +343,48 @@ class TestParseResponse:
         assert isinstance(result, expected_type)
 
 
+# -----------------------------------------------------------------------------
+# build_responder Tests
+# -----------------------------------------------------------------------------
+
+
+class TestBuildResponder:
+    """Tests for build_responder function."""
+
+    @pytest.mark.parametrize("annotation", [inspect.Signature.empty, str, "SampleModel", list[int]])
+    def test_unspecialized_annotations_use_parse_response(self, annotation) -> None:
+        """Verify missing or unsupported annotations fall back to parse_response."""
+        assert build_responder(annotation) is parse_response
+
+    @pytest.mark.parametrize(
+        ("annotation", "result"),
+        [
+            (SampleModel, SampleModel(name="x", value=1)),
+            (dict, {"a": 1}),
+            (dict[str, int], {"a": 1}),
+        ],
+    )
+    def test_specialized_matches_parse_response(self, annotation, result) -> None:
+        """Verify specialized responders produce the same JSON as parse_response."""
+        response = build_responder(annotation)(result)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.description == parse_response(result).description
+
+    def test_response_annotation_passes_through(self) -> None:
+        """Verify Response results are returned unchanged."""
+        original = Response(status_code=201, headers={}, description="created")
+        assert build_responder(Response)(original) is original
+
+    def test_mismatched_result_falls_back(self) -> None:
+        """Verify results not matching the annotation still convert correctly."""
+        response = build_responder(SampleModel)({"a": 1})
+
+        assert response.headers["content-type"] == "application/json"
+        assert "a" in str(response.description)
+
+
 # -----------------------------------------------------------------------------
 # UploadFile Model Tests
 # -----------------------------------------------------------------------------
@@ -252,3 +414,23 @@ class TestUploadFileModel:
         upload = UploadFile(files={"file": b"content"})
         assert upload.get("file") == b"content"
         assert upload.get("missing") is None
+
+    def test_upload_file_mapping_access(self) -> None:
+        """Verify membership, item access and keys() go straight to the mapping."""
+        upload = UploadFile(files={"file": b"content"})
+        assert "file" in upload
+        assert "missing" not in upload
+        assert upload["file"] == b"content"
+        assert upload.keys() == {"file"}
+        with pytest.raises(KeyError):
+            upload["missing"]
+
+    def test_upload_file_view(self) -> None:
+        """Verify UploadFile.view() exposes the stored bytes without copying."""
+        data = b"content"
+        upload = UploadFile(files={"file": data})
+        view = upload.view("file")
+        assert view is not None
+        assert view.obj is data
+        assert view.readonly
+        assert upload.view("missing") is None
@@ -0,0 +1,59 @@
+"""Tests for settings helpers."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from app.core.settings import Settings, get_version, read_pyproject
+
+
+@pytest.fixture
+def fresh_get_version() -> Generator[None, None, None]:
+    """Clear the get_version cache around a test."""
+    get_version.cache_clear()
+    yield
+    get_version.cache_clear()
+
+
+# -----------------------------------------------------------------------------
+# get_version Tests
+# -----------------------------------------------------------------------------
+
+
+class TestGetVersion:
+    """Tests for get_version function."""
+
+    def test_reads_build_time_version_file(self, tmp_path: Path, fresh_get_version: None) -> None:
+        """Verify the VERSION file written at build time takes precedence."""
+        (tmp_path / "VERSION").write_text("1.2.3\n")
+
+        assert get_version(tmp_path) == "1.2.3"
+
+    def test_result_is_cached(self, tmp_path: Path, fresh_get_version: None) -> None:
+        """Verify the version is resolved once per process."""
+        version_file = tmp_path / "VERSION"
+        version_file.write_text("1.2.3\n")
+        get_version(tmp_path)
+        version_file.write_text("9.9.9\n")
+
+        assert get_version(tmp_path) == "1.2.3"
+
+
+# -----------------------------------------------------------------------------
+# Settings Tests
+# -----------------------------------------------------------------------------
+
+
+class TestSettings:
+    """Tests for lazily resolved project metadata."""
+
+    def test_project_metadata_from_pyproject(self) -> None:
+        """Verify API name and description come from pyproject.toml."""
+        settings = Settings()
+        project = read_pyproject(Settings.BASE_DIR / "pyproject.toml")["project"]
+
+        name, description = settings.API_NAME, settings.API_DESCRIPTION
+
+        assert name == project["name"]
+        assert description == project["description"]
@@ -0,0 +1,13 @@
+"""Picklable tasks for process pool tests, importable by worker processes by plain module name."""
+
+from collections.abc import Sequence
+
+
+def cpu_bound_task(x: int) -> int:
+    """Simple CPU-bound task for testing."""
+    return x * x
+
+
+def cpu_bound_batch(xs: Sequence[int]) -> list[int]:
+    """Batched variant of cpu_bound_task: one submission and one result round-trip."""
+    return [x * x for x in xs]
@@ -1,16 +1,33 @@
 """Tests for process pool event."""
 
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Generator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import MagicMock, sentinel
 
 import pytest
-
-from app.events.process_pool import create_process_pool, process_pool_context
-
-
-def _cpu_bound_task(x: int) -> int:
-    """Simple CPU-bound task for testing."""
-    return x * x
+from _pool_helpers import cpu_bound_batch, cpu_bound_task
+
+from app.core.settings import settings as st
+from app.events import process_pool
+from app.events.process_pool import (
+    ProcessPoolEvent,
+    create_process_pool,
+    create_reusable_pool,
+    process_pool_context,
+)
+
+
+@pytest.fixture(params=["thread", "process"])
+def interop_executor(
+    request: pytest.FixtureRequest, shared_process_pool: ProcessPoolExecutor
+) -> Generator[Executor, None, None]:
+    """Executor for asyncio interop tests; threads skip pickling and worker start-up."""
+    if request.param == "process":
+        yield shared_process_pool
+        return
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yield pool
 
 
 def test_create_process_pool_returns_executor() -> None:
@@ -22,48 +39,42 @@ def test_create_process_pool_returns_executor() -> None:
         pool.shutdown(wait=True)
 
 
-def test_create_process_pool_executes_tasks() -> None:
-    """Verify pool can execute tasks."""
-    pool = create_process_pool(max_workers=2)
-    try:
-        results = list(pool.map(_cpu_bound_task, [1, 2, 3, 4]))
-        assert results == [1, 4, 9, 16]
-    finally:
-        pool.shutdown(wait=True)
+def test_shared_pool_executes_tasks(shared_process_pool: ProcessPoolExecutor) -> None:
+    """Verify the shared pool executes a batch of tasks."""
+    results = shared_process_pool.submit(cpu_bound_batch, [1, 2, 3, 4]).result()
+    assert results == [1, 4, 9, 16]
 
 
 def test_process_pool_context_manager() -> None:
-    """Verify context manager creates and shuts down pool."""
+    """Verify context manager creates a working production (spawn) pool and shuts it down."""
     with process_pool_context(max_workers=2) as pool:
         assert isinstance(pool, ProcessPoolExecutor)
-        result = pool.submit(_cpu_bound_task, 5).result()
-        assert result == 25
+        # Spawn workers must re-import and unpickle the task by module name
+        assert pool.submit(cpu_bound_task, 5).result() == 25
 
+    with pytest.raises(RuntimeError, match="shutdown"):
+        pool.submit(cpu_bound_task, 5)
 
-async def test_process_pool_asyncio_compatibility() -> None:
-    """Verify ProcessPoolExecutor works with asyncio.to_thread."""
-    pool = create_process_pool(max_workers=2)
 
-    def run_in_pool() -> list[int]:
-        return list(pool.map(_cpu_bound_task, range(5)))
+def test_shared_pool_submit(shared_process_pool: ProcessPoolExecutor) -> None:
+    """Verify single task submission returns its result."""
+    assert shared_process_pool.submit(cpu_bound_task, 5).result() == 25
 
-    try:
-        result = await asyncio.to_thread(run_in_pool)
-        assert result == [0, 1, 4, 9, 16]
-    finally:
-        pool.shutdown(wait=True)
 
+async def test_process_pool_asyncio_compatibility(interop_executor: Executor) -> None:
+    """Verify pool futures can be awaited directly from asyncio."""
+    futures = (asyncio.wrap_future(interop_executor.submit(cpu_bound_task, x)) for x in range(5))
 
-async def test_process_pool_run_in_executor() -> None:
-    """Verify ProcessPoolExecutor works with loop.run_in_executor."""
-    pool = create_process_pool(max_workers=2)
+    result = await asyncio.gather(*futures)
+    assert result == [0, 1, 4, 9, 16]
+
+
+async def test_process_pool_run_in_executor(interop_executor: Executor) -> None:
+    """Verify pool executors work with loop.run_in_executor."""
     loop = asyncio.get_running_loop()
 
-    try:
-        result = await loop.run_in_executor(pool, _cpu_bound_task, 7)
-        assert result == 49
-    finally:
-        pool.shutdown(wait=True)
+    result = await loop.run_in_executor(interop_executor, cpu_bound_task, 7)
+    assert result == 49
 
 
 @pytest.mark.parametrize("workers", [1, 2, 4])
@@ -74,3 +85,23 @@ def test_create_process_pool_respects_max_workers(workers: int) -> None:
         assert pool._max_workers == workers  # type: ignore[unresolved-attribute]
     finally:
         pool.shutdown(wait=True)
+
+
+async def test_process_pool_event_loky_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify the loky backend setting makes the event use the reusable executor."""
+    reusable = MagicMock(return_value=sentinel.executor)
+    monkeypatch.setattr(process_pool, "create_reusable_pool", reusable)
+    monkeypatch.setattr(st, "POOL_BACKEND", "loky")
+
+    assert await ProcessPoolEvent().startup() is sentinel.executor
+    reusable.assert_called_once_with(max_workers=st.MAX_WORKERS or None)
+
+
+def test_create_reusable_pool_executes_tasks() -> None:
+    """Verify the loky reusable executor runs the same tasks as the process pool."""
+    pytest.importorskip("joblib")
+    pool = create_reusable_pool(max_workers=2)
+    try:
+        assert list(pool.map(cpu_bound_task, [1, 2, 3, 4])) == [1, 4, 9, 16]
+    finally:
+        pool.shutdown(wait=True)
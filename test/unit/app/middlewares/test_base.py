@@ -0,0 +1,193 @@
+"""Tests for the base middleware architecture."""
+
+from inspect import iscoroutinefunction
+from unittest.mock import MagicMock, sentinel
+
+import pytest
+from robyn import Request, Response
+
+from app.middlewares.base import BaseMiddleware, MiddlewareHandler
+
+
+class BeforeOnly(BaseMiddleware):
+    def before(self, request: Request) -> Request | Response:
+        return request
+
+
+class ScopedAfter(BaseMiddleware):
+    endpoints = frozenset({"/a", "/b"})
+
+    def after(self, response: Response) -> Response:
+        return response
+
+
+class Passthrough(BaseMiddleware):
+    def before(self, request: Request) -> Request | Response:
+        return request
+
+    def after(self, response: Response) -> Response:
+        return response
+
+
+class ShortCircuit(Passthrough):
+    def before(self, request: Request) -> Request | Response:
+        return Response(status_code=403, headers={}, description="denied")
+
+
+class AsyncPassthrough(BaseMiddleware):
+    async def before(self, request: Request) -> Request | Response:
+        return request
+
+    def after(self, response: Response) -> Response:
+        return response
+
+
+class ScopedPassthrough(Passthrough):
+    endpoints = frozenset({"/a", "/b"})
+
+
+class ScopedAsyncPassthrough(AsyncPassthrough):
+    endpoints = frozenset({"/a", "/b"})
+
+
+# -----------------------------------------------------------------------------
+# BaseMiddleware Tests
+# -----------------------------------------------------------------------------
+
+
+class TestBaseMiddleware:
+    """Tests for BaseMiddleware subclass validation."""
+
+    def test_hook_flags_resolved_per_class(self) -> None:
+        """Verify implemented hooks are recorded as class flags."""
+        assert (BeforeOnly._has_before, BeforeOnly._has_after) == (True, False)
+        assert (ScopedAfter._has_before, ScopedAfter._has_after) == (False, True)
+
+    def test_targets_resolved_per_class(self) -> None:
+        """Verify endpoints resolve once to a tuple, with None meaning global."""
+        assert BeforeOnly._targets == (None,)
+        assert sorted(ScopedAfter._targets) == ["/a", "/b"]  # type: ignore[type-var]
+
+    def test_no_hooks_raises(self) -> None:
+        """Verify a subclass implementing neither hook is rejected."""
+        with pytest.raises(TypeError, match="at least one of before/after"):
+
+            class Empty(BaseMiddleware):
+                pass
+
+
+# -----------------------------------------------------------------------------
+# MiddlewareHandler Tests
+# -----------------------------------------------------------------------------
+
+
+class TestMiddlewareHandler:
+    """Tests for middleware registration on the app."""
+
+    def test_registers_only_implemented_hooks(self) -> None:
+        """Verify a middleware overriding one hook registers only that hook."""
+        app = MagicMock()
+        MiddlewareHandler(app).register(BeforeOnly).register(ScopedAfter).freeze()
+
+        app.before_request.assert_called_once_with(None)
+        assert sorted(call.args[0] for call in app.after_request.call_args_list) == ["/a", "/b"]
+
+    def test_without_endpoints_registers_globally(self) -> None:
+        """Verify endpoint-less middlewares register once as global hooks."""
+        app = MagicMock()
+        MiddlewareHandler(app).register(Passthrough).freeze()
+
+        app.before_request.assert_called_once_with(None)
+        app.after_request.assert_called_once_with(None)
+
+    def test_with_endpoints_registers_each(self) -> None:
+        """Verify scoped middlewares register both hooks on each declared endpoint."""
+        app = MagicMock()
+        MiddlewareHandler(app).register(ScopedPassthrough).freeze()
+
+        assert sorted(call.args[0] for call in app.before_request.call_args_list) == ["/a", "/b"]
+        assert sorted(call.args[0] for call in app.after_request.call_args_list) == ["/a", "/b"]
+
+    def test_shared_endpoint_registers_one_dispatcher(self) -> None:
+        """Verify middlewares on the same endpoint share one dispatcher that chains them."""
+        app = MagicMock()
+        handler = MiddlewareHandler(app).register(Passthrough).register(Passthrough).freeze()
+
+        app.before_request.assert_called_once_with(None)
+        app.after_request.assert_called_once_with(None)
+        assert len(handler._before_registry[None]) == 2
+        assert len(handler._after_registry[None]) == 2
+
+    def test_before_dispatch_short_circuits_on_response(self) -> None:
+        """Verify the before chain stops at the first hook returning a Response."""
+        app = MagicMock()
+        MiddlewareHandler(app).register(ShortCircuit).register(Passthrough).freeze()
+        dispatch = app.before_request.return_value.call_args.args[0]
+
+        result = dispatch(sentinel.request)
+
+        assert isinstance(result, Response)
+        assert result.status_code == 403
+
+    def test_register_defers_dispatchers_to_freeze(self) -> None:
+        """Verify nothing reaches Robyn until freeze() seals the chains."""
+        app = MagicMock()
+        handler = MiddlewareHandler(app).register(Passthrough)
+
+        app.before_request.assert_not_called()
+        app.after_request.assert_not_called()
+        handler.freeze().freeze()
+        app.before_request.assert_called_once_with(None)
+        with pytest.raises(RuntimeError, match="frozen"):
+            handler.register(Passthrough)
+
+    def test_start_without_freeze_raises(self) -> None:
+        """Verify app.start() refuses to run with registered but unfrozen middlewares."""
+        app = MagicMock()
+        start = app.start
+        MiddlewareHandler(app).register(Passthrough)
+
+        with pytest.raises(RuntimeError, match=r"freeze\(\) was never called.*Passthrough"):
+            app.start(port=8080)
+        start.assert_not_called()
+
+    @pytest.mark.parametrize("middleware_classes", [(), (Passthrough,)])
+    def test_start_passes_through_when_nothing_pending(self, middleware_classes: tuple) -> None:
+        """Verify app.start() delegates once middlewares are frozen or none were registered."""
+        app = MagicMock()
+        start = app.start
+        handler = MiddlewareHandler(app)
+        for middleware_cls in middleware_classes:
+            handler.register(middleware_cls)
+        if middleware_classes:
+            handler.freeze()
+
+        assert app.start(port=8080) is start.return_value
+        start.assert_called_once_with(port=8080)
+
+    def test_sync_chain_gets_sync_dispatcher(self) -> None:
+        """Verify a chain of sync hooks is dispatched without a coroutine."""
+        app = MagicMock()
+        MiddlewareHandler(app).register(Passthrough).register(Passthrough).freeze()
+        dispatch = app.before_request.return_value.call_args.args[0]
+
+        assert not iscoroutinefunction(dispatch)
+        assert dispatch(sentinel.request) is sentinel.request
+
+    async def test_mixed_scoped_chain_registers_once_per_endpoint(self) -> None:
+        """Verify mixing sync and async hooks on scoped endpoints still registers one async dispatcher each."""
+        app = MagicMock()
+        handler = MiddlewareHandler(app)
+        for middleware_cls in (ScopedPassthrough, ScopedAsyncPassthrough, ScopedPassthrough):
+            handler.register(middleware_cls)
+        handler.freeze()
+
+        assert sorted(call.args[0] for call in app.before_request.call_args_list) == ["/a", "/b"]
+        for call in app.before_request.return_value.call_args_list:
+            dispatch = call.args[0]
+            assert iscoroutinefunction(dispatch)
+            assert await dispatch(sentinel.request) is sentinel.request
+
+    def test_handler_has_no_dict(self) -> None:
+        """Verify the handler is fully slotted."""
+        assert not hasattr(MiddlewareHandler(MagicMock()), "__dict__")
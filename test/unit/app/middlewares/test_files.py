@@ -0,0 +1,127 @@
+"""Tests for the file upload OpenAPI middleware."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from app.core import router
+from app.middlewares.files import FileUploadOpenAPIMiddleware
+
+
+def _spec(*paths: str) -> str:
+    return orjson.dumps({"openapi": "3.0.0", "paths": {p: {"post": {"summary": p}} for p in paths}}).decode()
+
+
+@pytest.fixture
+def middleware(monkeypatch: pytest.MonkeyPatch) -> FileUploadOpenAPIMiddleware:
+    """Middleware with a single registered upload endpoint."""
+    monkeypatch.setattr(router, "FILE_UPLOAD_ENDPOINTS", frozenset({"/files/upload"}))
+    return FileUploadOpenAPIMiddleware(MagicMock())
+
+
+# -----------------------------------------------------------------------------
+# FileUploadOpenAPIMiddleware Tests
+# -----------------------------------------------------------------------------
+
+
+class TestFileUploadOpenAPIMiddleware:
+    """Tests for OpenAPI multipart patching."""
+
+    def test_registers_after_hook_only(self) -> None:
+        """Verify only the after hook is registered for the spec endpoint."""
+        assert (FileUploadOpenAPIMiddleware._has_before, FileUploadOpenAPIMiddleware._has_after) == (False, True)
+
+    def test_middleware_has_no_dict(self, middleware: FileUploadOpenAPIMiddleware) -> None:
+        """Verify the middleware is fully slotted."""
+        assert not hasattr(middleware, "__dict__")
+
+    def test_patches_upload_endpoints_only(self, middleware: FileUploadOpenAPIMiddleware) -> None:
+        """Verify only registered upload endpoints get a multipart requestBody."""
+        response = SimpleNamespace(description=_spec("/files/upload", "/health"))
+
+        patched = middleware.after(response).description  # type: ignore[arg-type]
+        paths = orjson.loads(patched)["paths"]
+
+        assert isinstance(patched, bytes)
+        request_body = paths["/files/upload"]["post"]["requestBody"]
+        assert "multipart/form-data" in request_body["content"]
+        assert request_body["required"] is True
+        assert "requestBody" not in paths["/health"]["post"]
+
+    def test_path_level_fields_are_not_patched(self, middleware: FileUploadOpenAPIMiddleware) -> None:
+        """Verify non-operation path item fields are left alone while operations are patched."""
+        spec = {"paths": {"/files/upload": {"summary": "Upload", "parameters": [], "servers": [{}], "post": {}}}}
+        response = SimpleNamespace(description=orjson.dumps(spec).decode())
+
+        path_item = orjson.loads(middleware.after(response).description)["paths"]["/files/upload"]  # type: ignore[arg-type]
+
+        assert "multipart/form-data" in path_item["post"]["requestBody"]["content"]
+        assert (path_item["summary"], path_item["parameters"], path_item["servers"]) == ("Upload", [], [{}])
+
+    def test_more_endpoints_than_paths(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify patching is the same when the spec has fewer paths than upload endpoints."""
+        endpoints = frozenset({"/files/upload", "/a", "/b", "/c"})
+        monkeypatch.setattr(router, "FILE_UPLOAD_ENDPOINTS", endpoints)
+        response = SimpleNamespace(description=_spec("/files/upload", "/health"))
+
+        paths = orjson.loads(FileUploadOpenAPIMiddleware(MagicMock()).after(response).description)["paths"]  # type: ignore[arg-type]
+
+        assert "requestBody" in paths["/files/upload"]["post"]
+        assert "requestBody" not in paths["/health"]["post"]
+
+    def test_no_upload_endpoints_leaves_spec(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify the spec is untouched when no upload endpoints are registered."""
+        monkeypatch.setattr(router, "FILE_UPLOAD_ENDPOINTS", frozenset())
+        spec = _spec("/files/upload")
+        response = SimpleNamespace(description=spec)
+
+        assert FileUploadOpenAPIMiddleware(MagicMock()).after(response).description == spec  # type: ignore[arg-type]
+
+    def test_invalid_json_passes_through(self, middleware: FileUploadOpenAPIMiddleware) -> None:
+        """Verify non-JSON bodies are returned unchanged."""
+        response = SimpleNamespace(description="not json")
+
+        assert middleware.after(response).description == "not json"  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("description", ['{"/files/upload": ', '["/files/upload"]', '{"paths": "/files/upload"}'])
+    def test_unpatchable_spec_passes_through(self, middleware: FileUploadOpenAPIMiddleware, description: str) -> None:
+        """Verify bodies mentioning an upload path but lacking a paths object are unchanged."""
+        response = SimpleNamespace(description=description)
+
+        assert middleware.after(response).description == description  # type: ignore[arg-type]
+
+    def test_patched_spec_is_cached(
+        self, middleware: FileUploadOpenAPIMiddleware, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify repeated requests for the same spec reuse the patched result."""
+        spec = _spec("/files/upload")
+        first = middleware.after(SimpleNamespace(description=spec)).description  # type: ignore[arg-type]
+
+        loads = MagicMock(side_effect=orjson.loads)
+        monkeypatch.setattr(orjson, "loads", loads)
+        second = middleware.after(SimpleNamespace(description=spec)).description  # type: ignore[arg-type]
+
+        assert second == first
+        loads.assert_not_called()
+
+    def test_cache_is_bounded(self, middleware: FileUploadOpenAPIMiddleware) -> None:
+        """Verify the cache evicts the oldest spec past its size."""
+        specs = [_spec("/files/upload", f"/extra/{i}") for i in range(middleware.cache_size + 1)]
+        for spec in specs:
+            middleware.after(SimpleNamespace(description=spec))  # type: ignore[arg-type]
+
+        assert len(middleware._cache) == middleware.cache_size
+        assert specs[0] not in middleware._cache
+
+    def test_spec_without_upload_paths_skips_parsing(
+        self, middleware: FileUploadOpenAPIMiddleware, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify specs that never mention an upload path are returned without a JSON parse."""
+        loads = MagicMock(side_effect=orjson.loads)
+        monkeypatch.setattr(orjson, "loads", loads)
+        spec = _spec("/health")
+
+        assert middleware.after(SimpleNamespace(description=spec)).description == spec  # type: ignore[arg-type]
+        loads.assert_not_called()
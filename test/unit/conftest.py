@@ -1,12 +1,28 @@
 """Test fixtures for robyn-ml-api unit tests."""
 
-import json
+import multiprocessing as mp
+import sys
 from collections.abc import Generator
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
+import orjson
 import pytest
 
 from app.core.lifespan import State
+from app.events.process_pool import CPU_COUNT
+
+
+# Pool tests submit functions from _pool_helpers; workers unpickle them by module name,
+# so the directory must be importable regardless of pytest's --import-mode.
+POOL_HELPERS_DIR = str(Path(__file__).parent / "app" / "events")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Put the pool helper module on sys.path before any worker process is started."""
+    if POOL_HELPERS_DIR not in sys.path:
+        sys.path.insert(0, POOL_HELPERS_DIR)
 
 
 # -----------------------------------------------------------------------------
@@ -14,37 +30,41 @@ from app.core.lifespan import State
 # -----------------------------------------------------------------------------
 
 
-@dataclass
-class MockHeaders:
+class MockHeaders(dict[str, str]):
     """Mock Headers object for Robyn Request."""
 
-    _data: dict = field(default_factory=dict)
-
-    def get(self, key: str, default: str | None = None) -> str | None:
-        return self._data.get(key, default)
+    __slots__ = ()
 
     def set(self, key: str, value: str) -> None:
-        self._data[key] = value
+        self[key] = value
 
-    def __getitem__(self, key: str) -> str:
-        return self._data[key]
 
-    def __setitem__(self, key: str, value: str) -> None:
-        self._data[key] = value
+@lru_cache(maxsize=128)
+def _parse_json(body: str) -> dict:
+    """Parse a JSON body once per distinct string; the shared result must not be mutated."""
+    return orjson.loads(body)
 
 
-@dataclass
 class MockRequest:
     """Mock Request object for Robyn."""
 
-    _body: dict | str = field(default_factory=dict)
-    headers: MockHeaders = field(default_factory=MockHeaders)
-    method: str = "GET"
-    path: str = "/"
+    __slots__ = ("_body", "headers", "method", "path")
+
+    def __init__(
+        self,
+        _body: dict | str | None = None,
+        headers: MockHeaders | None = None,
+        method: str = "GET",
+        path: str = "/",
+    ) -> None:
+        self._body = {} if _body is None else _body
+        self.headers = MockHeaders() if headers is None else headers
+        self.method = method
+        self.path = path
 
     def json(self) -> dict:
         if isinstance(self._body, str):
-            return json.loads(self._body)
+            return _parse_json(self._body)
         return self._body
 
 
@@ -61,9 +81,14 @@ def test_state() -> State:
 
 @pytest.fixture
 def global_dependencies(test_state: State) -> Generator[dict, None, None]:
-    """Setup global dependencies for tests."""
+    """Setup global dependencies for tests, restoring the state snapshot afterwards."""
+    snapshot = vars(test_state).copy()
     yield {"state": test_state}
-    test_state.clear()
+    # State.__dict__ cannot be rebound on a SimpleNamespace, so restore it in place. No
+    # equality shortcut: values like numpy arrays make dict comparison raise.
+    state_dict = vars(test_state)
+    state_dict.clear()
+    state_dict.update(snapshot)
 
 
 @pytest.fixture
@@ -74,3 +99,27 @@ def make_mock_request(global_dependencies):
         return MockRequest(_body=body or {})
 
     return _make
+
+
+# -----------------------------------------------------------------------------
+# Process pool fixture
+# -----------------------------------------------------------------------------
+
+
+# Tests that only exercise pool plumbing fork workers from a single-threaded forkserver
+# instead of paying the production spawn context's interpreter start-up per worker.
+# Plain fork is avoided: the session process may already run the log-writer thread.
+if "forkserver" in mp.get_all_start_methods():
+    FAST_MP_CONTEXT = mp.get_context("forkserver")
+else:
+    FAST_MP_CONTEXT = mp.get_context("spawn")
+SHARED_POOL_WORKERS = min(CPU_COUNT, 2)
+
+
+@pytest.fixture(scope="session")
+def shared_process_pool() -> Generator[ProcessPoolExecutor, None, None]:
+    """Single forkserver-context process pool shared across the session so workers start once."""
+    with ProcessPoolExecutor(max_workers=SHARED_POOL_WORKERS, mp_context=FAST_MP_CONTEXT) as pool:
+        # Warm up during fixture setup so worker start-up isn't timed in the first test
+        list(pool.map(int, range(SHARED_POOL_WORKERS)))
+        yield pool